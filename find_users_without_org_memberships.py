@@ -7,22 +7,234 @@ if those users have any organization memberships.
 """
 
 import argparse
+import hashlib
+import importlib
+import importlib.machinery
+import importlib.util
 import json
 import logging
 import os
+import random
 import sys
+import tempfile
+import threading
 import time
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Any, Callable, ClassVar, Dict, FrozenSet, Iterator, List, Optional, Tuple
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+log = logging.getLogger(__name__)
+
+
+def parse_json(content: bytes) -> Any:
+    """
+    Decode a JSON document, using orjson when it is installed.
+    
+    Args:
+        content: Raw JSON bytes, e.g. a response body
+        
+    Returns:
+        The decoded JSON value
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def write_json(path: str, data: Any):
+    """
+    Write a value to a file as indented JSON, using orjson when it is installed.
+    
+    Args:
+        path: Output file path
+        data: JSON-serializable value
+    """
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2)
+
+
+class SnykAPIError(Exception):
+    """Raised when a paginated listing could not be fetched completely."""
+
+
+class ClientRateController:
+    """
+    Thread-safe client-side rate controller using additive-increase/multiplicative-decrease.
+    
+    The request rate grows by a fixed step after each successful response and is cut by a
+    constant factor when the API answers 429, so the client settles just below the server's quota.
+    """
+    
+    def __init__(self, rate: float = 50.0, min_rate: float = 1.0, max_rate: Optional[float] = None,
+                 increase: float = 0.5, decrease: float = 0.5):
+        """
+        Initialize the rate controller.
+        
+        Args:
+            rate: Initial number of requests per second
+            min_rate: Lowest rate the controller backs off to
+            max_rate: Highest rate the controller grows to (defaults to the initial rate)
+            increase: Requests per second added after each successful response
+            decrease: Factor the rate is multiplied by when rate limited
+        """
+        self.max_rate = max_rate if max_rate is not None else rate
+        self.min_rate = min(min_rate, self.max_rate)
+        self.rate = rate
+        self.increase = increase
+        self.decrease = decrease
+        self.next_request_at = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until the next request may be sent at the current rate."""
+        with self.lock:
+            now = time.monotonic()
+            send_at = max(now, self.next_request_at)
+            self.next_request_at = send_at + 1.0 / self.rate
+        if send_at > now:
+            time.sleep(send_at - now)
+    
+    def on_success(self):
+        """Additively increase the rate after a successful response."""
+        with self.lock:
+            self.rate = min(self.max_rate, self.rate + self.increase)
+    
+    def on_throttle(self, retry_after: float = 0):
+        """
+        Multiplicatively decrease the rate after a 429 response.
+        
+        Args:
+            retry_after: Seconds the server asked clients to wait before retrying
+        """
+        with self.lock:
+            self.rate = max(self.min_rate, self.rate * self.decrease)
+            # Hold back every worker until the server's Retry-After window has passed
+            self.next_request_at = max(self.next_request_at, time.monotonic() + retry_after)
+            log.info("Rate limited - reducing request rate to %.1f req/s", self.rate)
+
+
+class ResponseCache:
+    """File-backed cache of API results that expire after a time-to-live."""
+    
+    def __init__(self, cache_dir: str = "~/.cache/snyk_mc", ttl: float = 300, refresh: bool = False,
+                 revalidated_ttl: float = 86400):
+        """
+        Initialize the response cache and remove entries that have outlived both TTLs.
+        
+        Args:
+            cache_dir: Directory where cache entries are stored
+            ttl: Number of seconds an entry stays valid
+            refresh: If True, ignore existing entries but still store fresh results
+            revalidated_ttl: Number of seconds an entry that is revalidated with the server
+                (e.g. by ETag) is kept since it was last stored or confirmed unchanged
+        """
+        self.cache_dir = os.path.expanduser(cache_dir)
+        self.ttl = ttl
+        self.refresh = refresh
+        self.revalidated_ttl = revalidated_ttl
+        
+        if not os.path.exists(self.cache_dir):
+            os.makedirs(self.cache_dir, exist_ok=True)
+        
+        self.prune()
+    
+    def prune(self):
+        """Delete cache files (including leftover temporary files) older than every TTL."""
+        cutoff = time.time() - max(self.ttl, self.revalidated_ttl)
+        try:
+            names = os.listdir(self.cache_dir)
+        except OSError as e:
+            log.warning("Could not prune cache: %s", e)
+            return
+        
+        for name in names:
+            if not name.endswith((".json", ".tmp")):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                if os.path.getmtime(path) < cutoff:
+                    os.remove(path)
+            except OSError:
+                # Another run may have replaced or removed the file already
+                pass
+    
+    def _path(self, key: str) -> str:
+        """Return the file path for a cache key."""
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}.json")
+    
+    def get(self, key: str, revalidated: bool = False) -> Optional[Any]:
+        """
+        Look up a cache entry.
+        
+        Args:
+            key: Cache key
+            revalidated: If True, the entry is revalidated with the server before use, so it
+                is returned even in refresh mode and expires after revalidated_ttl instead of ttl
+            
+        Returns:
+            The cached payload, or None if missing, expired or refreshing
+        """
+        if self.refresh and not revalidated:
+            return None
+        
+        try:
+            with open(self._path(key)) as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        
+        ttl = self.revalidated_ttl if revalidated else self.ttl
+        if time.time() - entry.get("timestamp", 0) >= ttl:
+            return None
+        return entry.get("payload")
+    
+    def set(self, key: str, payload: Any):
+        """
+        Store a cache entry.
+        
+        Args:
+            key: Cache key
+            payload: JSON-serializable value to store
+        """
+        try:
+            # Write to a temporary file first so concurrent readers never see a partial entry
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump({"timestamp": time.time(), "payload": payload}, f)
+            os.replace(tmp_path, self._path(key))
+        except OSError as e:
+            log.warning("Could not write cache entry: %s", e)
+
 
 class SnykAPIClient:
     """Client for interacting with the Snyk API."""
     
-    def __init__(self, token: str, region: str = "SNYK-US-01", version: str = "2025-11-05"):
+    # Responses worth retrying; other 4xx errors will not succeed on a retry
+    RETRYABLE_STATUS_CODES: ClassVar[FrozenSet[int]] = frozenset([429, 500, 502, 503, 504])
+    MAX_RETRIES: ClassVar[int] = 5
+    DEFAULT_PAGE_SIZE: ClassVar[int] = 100
+    MAX_PAGE_SIZE: ClassVar[int] = 500
+    BACKOFF_BASE: ClassVar[float] = 1.0
+    BACKOFF_MAX: ClassVar[float] = 30.0
+    BACKOFF_JITTER: ClassVar[float] = 0.5
+    
+    def __init__(self, token: str, region: str = "SNYK-US-01", version: str = "2025-11-05",
+                 max_connections: int = 20, rate_limit: float = 50.0,
+                 cache: Optional[ResponseCache] = None, page_size: int = DEFAULT_PAGE_SIZE):
         """
         Initialize the Snyk API client.
         
@@ -30,10 +242,25 @@ class SnykAPIClient:
             token: Snyk API token
             region: Snyk region (SNYK-US-01, SNYK-US-02, SNYK-EU-01, SNYK-AU-01)
             version: API version
+            max_connections: Number of pooled connections kept open to the API host
+            rate_limit: Maximum number of requests sent per second; the client backs off below
+                this when the API responds with 429
+            cache: Optional cache for org membership results and ETag-validated responses
+            page_size: Number of results requested per page when paginating (unless a
+                per-endpoint size has been probed)
         """
         self.token = token
         self.version = version
         self.region = region
+        self.rate_controller = ClientRateController(rate=rate_limit)
+        self.cache = cache
+        self.page_size = page_size
+        # Page sizes discovered per listing collection, overriding page_size
+        self.page_sizes: Dict[str, int] = {}
+        
+        # GET requests currently in flight, keyed by full request URL, so duplicates can share them
+        self._inflight: Dict[str, "Future[requests.Response]"] = {}
+        self._inflight_lock = threading.Lock()
         
         # Determine API base URL based on region
         region_map = {
@@ -49,22 +276,163 @@ class SnykAPIClient:
             "Content-Type": "application/vnd.api+json",
             "Accept": "application/vnd.api+json"
         }
+        self._content_encoding_logged = False
         
         # Create a session with retry strategy for better reliability
         self.session = requests.Session()
         self.session.headers.update(self.headers)
         
-        # Configure retry strategy
+        # Configure retry strategy for connection-level errors; retryable status codes
+        # are handled in _send so the rate controller can react to them
         retry_strategy = Retry(
             total=3,
             backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["GET"]
+            allowed_methods=["GET"],
+            respect_retry_after_header=False
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # Size the pool so concurrent workers can share the session without discarding connections
+        adapter = HTTPAdapter(max_retries=retry_strategy, pool_connections=4, pool_maxsize=max_connections)
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
     
+    def _backoff_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """
+        Calculate how long to wait before retrying a request.
+        
+        Args:
+            attempt: Zero-based number of the attempt that failed
+            retry_after: Value of the response's Retry-After header, if any
+            
+        Returns:
+            Delay in seconds: exponential backoff with jitter, but never less than Retry-After
+        """
+        delay = min(self.BACKOFF_MAX, self.BACKOFF_BASE * 2 ** attempt)
+        delay *= 1 + random.uniform(-self.BACKOFF_JITTER, self.BACKOFF_JITTER)
+        
+        if retry_after:
+            try:
+                delay = max(delay, float(retry_after))
+            except ValueError:
+                # Retry-After may also be an HTTP date; fall back to the computed backoff
+                pass
+        
+        return delay
+    
+    def _send(self, method: str, url: str, params: Optional[Dict] = None,
+              headers: Optional[Dict] = None) -> requests.Response:
+        """
+        Send a request through the rate controller, retrying rate-limited and server errors
+        with exponential backoff.
+        
+        Args:
+            method: HTTP method
+            url: Full request URL
+            params: Query parameters
+            headers: Extra request headers
+            
+        Returns:
+            The HTTP response (the last one received if all retries failed)
+        """
+        for attempt in range(self.MAX_RETRIES + 1):
+            self.rate_controller.acquire()
+            response = self.session.request(method, url, params=params, headers=headers, timeout=30)
+            
+            if response.status_code not in self.RETRYABLE_STATUS_CODES:
+                if response.ok:
+                    self.rate_controller.on_success()
+                    if not self._content_encoding_logged:
+                        self._content_encoding_logged = True
+                        log.debug("Response Content-Encoding: %s", response.headers.get("Content-Encoding", "identity"))
+                return response
+            
+            delay = self._backoff_delay(attempt, response.headers.get("Retry-After"))
+            if response.status_code == 429:
+                # Slow down every worker, not just the one that was rate limited
+                self.rate_controller.on_throttle(delay)
+            
+            if attempt == self.MAX_RETRIES:
+                break
+            
+            log.warning("Request failed with status %d. Retrying in %.1f seconds (attempt %d/%d)...",
+                        response.status_code, delay, attempt + 1, self.MAX_RETRIES)
+            if response.status_code != 429:
+                time.sleep(delay)
+        
+        return response
+    
+    def _conditional_get(self, url: str, params: Optional[Dict] = None) -> requests.Response:
+        """
+        Send a GET request, revalidating a previously cached response with its ETag.
+        
+        Concurrent identical GET requests (including follow-up pages of a listing) are
+        coalesced: while one is in flight, other callers asking for the same URL wait for
+        and share its response.
+        
+        Args:
+            url: Full request URL
+            params: Query parameters
+            
+        Returns:
+            The HTTP response
+        """
+        request_url = requests.Request("GET", url, params=params).prepare().url or url
+        with self._inflight_lock:
+            future = self._inflight.get(request_url)
+            is_leader = future is None
+            if future is None:
+                future = Future()
+                self._inflight[request_url] = future
+        
+        if not is_leader:
+            log.debug("Waiting for in-flight request to %s", request_url)
+            return future.result()
+        
+        try:
+            response = self._revalidating_get(url, params, request_url)
+            future.set_result(response)
+            return response
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(request_url, None)
+    
+    def _revalidating_get(self, url: str, params: Optional[Dict], request_url: str) -> requests.Response:
+        """
+        Send a GET request, revalidating a previously cached response with its ETag.
+        
+        When the server answers 304 Not Modified, the cached body is served as a 200 response,
+        so callers handle both cases the same way.
+        
+        Args:
+            url: Full request URL
+            params: Query parameters
+            request_url: The prepared request URL, including query parameters
+            
+        Returns:
+            The HTTP response
+        """
+        if not self.cache:
+            return self._send("GET", url, params)
+        
+        cache_key = f"etag:{request_url}"
+        cached = self.cache.get(cache_key, revalidated=True)
+        headers = {"If-None-Match": cached["etag"]} if cached else None
+        
+        response = self._send("GET", url, params, headers=headers)
+        
+        if response.status_code == 304 and cached:
+            log.debug("Not modified, using cached response for %s", url)
+            response.status_code = 200
+            response._content = cached["body"].encode("utf-8")
+            # Restart the entry's age so pages that are still in use are not pruned
+            self.cache.set(cache_key, cached)
+        elif response.status_code == 200 and response.headers.get("ETag"):
+            self.cache.set(cache_key, {"etag": response.headers["ETag"], "body": response.content.decode("utf-8")})
+        
+        return response
+    
     def _make_request(self, method: str, endpoint: str, params: Optional[Dict] = None) -> Optional[Dict]:
         """
         Make an API request to Snyk.
@@ -77,41 +445,105 @@ class SnykAPIClient:
         Returns:
             JSON response as dictionary, or None if error
         """
-        url = f"{self.base_url}{endpoint}"
-        
         if params is None:
             params = {}
         
         # Always include version parameter
         params["version"] = self.version
         
-        try:
-            response = self.session.request(method, url, params=params, timeout=30)
+        return self._perform_request(method, endpoint, params)
+    
+    def _perform_request(self, method: str, endpoint: str, params: Dict) -> Optional[Dict]:
+        """
+        Send an API request and decode its response.
+        
+        Args:
+            method: HTTP method
+            endpoint: API endpoint path
+            params: Query parameters, including the API version
             
-            # Handle rate limiting
-            if response.status_code == 429:
-                retry_after = int(response.headers.get("Retry-After", 60))
-                logging.warning(f"Rate limited. Waiting {retry_after} seconds...")
-                time.sleep(retry_after)
-                # Retry once after rate limit
-                response = self.session.request(method, url, params=params, timeout=30)
+        Returns:
+            JSON response as dictionary, or None if error
+        """
+        url = f"{self.base_url}{endpoint}"
+        
+        try:
+            if method == "GET":
+                response = self._conditional_get(url, params)
+            else:
+                response = self._send(method, url, params)
             
             if response.status_code == 200:
-                return response.json()
+                return parse_json(response.content)
             elif response.status_code == 204:
                 return {"status": "success", "message": "No content"}
             elif response.status_code == 404:
-                logging.warning(f"Resource not found: {endpoint}")
+                log.warning("Resource not found: %s", endpoint)
                 return None
             else:
-                logging.error(f"API request failed: {response.status_code} - {response.text}")
+                log.error("API request failed: %d - %s", response.status_code, response.text)
+                # Only blame the page size when it is one the user chose above the default;
+                # probed sizes were already accepted, and other 400s (e.g. a bad filter) are unrelated
+                collection = endpoint.rstrip("/").rsplit("/", 1)[-1]
+                if (response.status_code == 400 and params.get("limit", 0) > self.DEFAULT_PAGE_SIZE
+                        and collection not in self.page_sizes):
+                    log.error("The API may not accept a page size of %s; try a smaller --page-size", params["limit"])
                 response.raise_for_status()
                 return None
                 
-        except requests.exceptions.RequestException as e:
-            logging.error(f"Request exception: {str(e)}")
+        except (requests.exceptions.RequestException, ValueError) as e:
+            log.error("Request exception: %s", e)
             return None
     
+    def _probe_collection_page_size(self, url: str) -> int:
+        """
+        Find the largest page size a listing endpoint accepts, starting from MAX_PAGE_SIZE and
+        halving on each 400 response, but never going below DEFAULT_PAGE_SIZE.
+        
+        Args:
+            url: Full URL of the listing endpoint
+            
+        Returns:
+            The largest accepted page size
+        """
+        page_size = self.MAX_PAGE_SIZE
+        
+        while page_size > self.DEFAULT_PAGE_SIZE:
+            try:
+                response = self._send("GET", url, {"version": self.version, "limit": page_size})
+            except requests.exceptions.RequestException as e:
+                log.warning("Page size probe failed: %s", e)
+                return self.DEFAULT_PAGE_SIZE
+            
+            if response.status_code == 200:
+                return page_size
+            if response.status_code != 400:
+                log.warning("Page size probe failed: %d - %s", response.status_code, response.text)
+                return self.DEFAULT_PAGE_SIZE
+            
+            log.debug("Page size %d rejected by %s", page_size, url)
+            page_size = max(self.DEFAULT_PAGE_SIZE, page_size // 2)
+        
+        return self.DEFAULT_PAGE_SIZE
+    
+    def probe_page_size(self, group_id: str) -> Dict[str, int]:
+        """
+        Find the largest page size each listing endpoint accepts. Endpoints may have different
+        maximums, so every endpoint is probed separately and gets its own page size.
+        
+        Args:
+            group_id: Snyk group ID used for the probe requests
+            
+        Returns:
+            Dictionary mapping listing collection names to the page size that will be used
+        """
+        for collection in ("memberships", "org_memberships"):
+            url = f"{self.base_url}/rest/groups/{group_id}/{collection}"
+            self.page_sizes[collection] = self._probe_collection_page_size(url)
+            log.info("Using page size %d for %s", self.page_sizes[collection], collection)
+        
+        return dict(self.page_sizes)
+    
     def get_group_memberships(self, group_id: str, role_name: Optional[str] = None) -> List[Dict]:
         """
         Get group memberships, optionally filtered by role name.
@@ -123,18 +555,22 @@ class SnykAPIClient:
             
         Returns:
             List of membership objects
+            
+        Raises:
+            SnykAPIError: If any page could not be fetched
         """
         endpoint = f"/rest/groups/{group_id}/memberships"
-        params = {}
+        params: Dict[str, Any] = {}
         
         if role_name:
             params["role_name"] = role_name
         
         # Use a higher limit to reduce number of pagination requests
-        params["limit"] = 100
+        params["limit"] = self.page_sizes.get("memberships", self.page_size)
         
         all_memberships = []
         next_url = None
+        complete = False
         
         while True:
             # Use next_url if available, otherwise make initial request
@@ -145,14 +581,15 @@ class SnykAPIClient:
                     next_url = "/rest" + next_url
                 url = f"{self.base_url}{next_url}"
                 try:
-                    response = requests.request("GET", url, headers=self.headers, timeout=30)
+                    # Reuse the pooled session so pages share keep-alive connections and the retry strategy
+                    response = self._conditional_get(url)
                     if response.status_code == 200:
-                        response_data = response.json()
+                        response_data = parse_json(response.content)
                     else:
-                        logging.error(f"Pagination request failed: {response.status_code} - {response.text}")
+                        log.error("Pagination request failed: %d - %s", response.status_code, response.text)
                         break
-                except requests.exceptions.RequestException as e:
-                    logging.error(f"Pagination request exception: {str(e)}")
+                except (requests.exceptions.RequestException, ValueError) as e:
+                    log.error("Pagination request exception: %s", e)
                     break
             else:
                 response_data = self._make_request("GET", endpoint, params)
@@ -161,22 +598,28 @@ class SnykAPIClient:
             
             if response_data and "data" in response_data:
                 all_memberships.extend(response_data["data"])
-                logging.info(f"Fetched {len(response_data['data'])} memberships (total so far: {len(all_memberships)})")
+                log.info("Fetched %d memberships (total so far: %d)", len(response_data["data"]), len(all_memberships))
             
             # Check for next page
             links = response_data.get("links", {})
             next_url = links.get("next")
             
             if not next_url:
-                logging.info("No more pages to fetch")
+                log.info("No more pages to fetch")
+                complete = True
                 break
             else:
-                logging.info(f"Found next page URL: {next_url}")
+                log.info("Found next page URL: %s", next_url)
         
-        logging.info(f"Total group memberships fetched: {len(all_memberships)}")
+        # A partial listing would silently drop users from the check, so treat it as a failure
+        if not complete:
+            raise SnykAPIError(f"Could not fetch all group memberships for group {group_id}")
+        
+        log.info("Total group memberships fetched: %d", len(all_memberships))
         return all_memberships
     
-    def get_org_memberships(self, group_id: str, user_id: Optional[str] = None) -> List[Dict]:
+    def get_org_memberships(self, group_id: str, user_id: Optional[str] = None,
+                            stop: Optional[threading.Event] = None) -> List[Dict]:
         """
         Get organization memberships for a group, optionally filtered by user ID.
         Handles pagination to fetch all results.
@@ -184,23 +627,39 @@ class SnykAPIClient:
         Args:
             group_id: Snyk group ID
             user_id: Optional user ID to filter by
+            stop: Optional event that, once set, stops pagination before the next page
             
         Returns:
             List of organization membership objects
+            
+        Raises:
+            SnykAPIError: If any page could not be fetched
         """
+        cache_key = f"{group_id}:{user_id or '*'}:{self.version}"
+        if self.cache:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                log.debug("Using cached org memberships for user %s", user_id or "all users")
+                return cached
+        
         endpoint = f"/rest/groups/{group_id}/org_memberships"
-        params = {}
+        params: Dict[str, Any] = {}
         
         if user_id:
             params["user_id"] = user_id
         
         # Use a higher limit to reduce number of pagination requests
-        params["limit"] = 100
+        params["limit"] = self.page_sizes.get("org_memberships", self.page_size)
         
-        all_org_memberships = []
+        all_org_memberships: List[Dict] = []
         next_url = None
+        complete = False
         
         while True:
+            if stop is not None and stop.is_set():
+                log.debug("Stopped fetching org memberships for user %s", user_id or "all users")
+                break
+            
             # Use next_url if available, otherwise make initial request
             if next_url:
                 # next_url is a relative path like /groups/{group_id}/org_memberships?version=...&limit=10&starting_after=...
@@ -209,14 +668,15 @@ class SnykAPIClient:
                     next_url = "/rest" + next_url
                 url = f"{self.base_url}{next_url}"
                 try:
-                    response = requests.request("GET", url, headers=self.headers, timeout=30)
+                    # Reuse the pooled session so pages share keep-alive connections and the retry strategy
+                    response = self._conditional_get(url)
                     if response.status_code == 200:
-                        response_data = response.json()
+                        response_data = parse_json(response.content)
                     else:
-                        logging.error(f"Pagination request failed: {response.status_code} - {response.text}")
+                        log.error("Pagination request failed: %d - %s", response.status_code, response.text)
                         break
-                except requests.exceptions.RequestException as e:
-                    logging.error(f"Pagination request exception: {str(e)}")
+                except (requests.exceptions.RequestException, ValueError) as e:
+                    log.error("Pagination request exception: %s", e)
                     break
             else:
                 response_data = self._make_request("GET", endpoint, params)
@@ -225,22 +685,58 @@ class SnykAPIClient:
             
             if response_data and "data" in response_data:
                 all_org_memberships.extend(response_data["data"])
-                logging.debug(f"Fetched {len(response_data['data'])} org memberships for user {user_id} (total so far: {len(all_org_memberships)})")
+                log.debug("Fetched %d org memberships for user %s (total so far: %d)",
+                          len(response_data["data"]), user_id or "all users", len(all_org_memberships))
             
             # Check for next page
             links = response_data.get("links", {})
             next_url = links.get("next")
             
             if not next_url:
+                complete = True
                 break
         
+        # A partial listing would make users look like they have no org memberships,
+        # so treat it as a failure (and never cache it)
+        if not complete:
+            raise SnykAPIError(f"Could not fetch all org memberships for {f'user {user_id}' if user_id else f'group {group_id}'}")
+        
+        if self.cache:
+            self.cache.set(cache_key, all_org_memberships)
+        
         return all_org_memberships
+    
+    def get_all_org_memberships(self, group_id: str,
+                                stop: Optional[threading.Event] = None) -> Dict[str, List[Dict]]:
+        """
+        Get every organization membership in a group with a single paginated listing,
+        grouped by user ID.
+        
+        Args:
+            group_id: Snyk group ID
+            stop: Optional event that, once set, stops pagination before the next page
+            
+        Returns:
+            Dictionary mapping user IDs to their organization membership objects
+            
+        Raises:
+            SnykAPIError: If any page could not be fetched
+        """
+        org_memberships_by_user = defaultdict(list)
+        for org_membership in self.get_org_memberships(group_id, stop=stop):
+            user_id = org_membership.get("relationships", {}).get("user", {}).get("data", {}).get("id")
+            if user_id:
+                org_memberships_by_user[user_id].append(org_membership)
+        
+        log.info("Fetched org memberships for %d user(s) in group %s", len(org_memberships_by_user), group_id)
+        return dict(org_memberships_by_user)
 
 
 class MembershipChecker:
     """Main class for checking group and organization memberships."""
     
-    def __init__(self, client: SnykAPIClient, group_id: str, role_name: Optional[str] = None):
+    def __init__(self, client: SnykAPIClient, group_id: str, role_name: Optional[str] = None,
+                 concurrency: int = 20, per_user_lookup: bool = False):
         """
         Initialize the membership checker.
         
@@ -248,18 +744,131 @@ class MembershipChecker:
             client: SnykAPIClient instance
             group_id: Snyk group ID
             role_name: Optional role name to filter group memberships
+            concurrency: Number of users whose org memberships are fetched in parallel
+            per_user_lookup: If True, query org memberships per user instead of listing
+                all org memberships in the group once
         """
         self.client = client
         self.group_id = group_id
         self.role_name = role_name
-        self.results = {
+        self.concurrency = concurrency
+        self.per_user_lookup = per_user_lookup
+        # User buckets are stored column-wise (one list per field) rather than as one dict per
+        # user, and org memberships live in a single flat table that references users by their
+        # index in users_with_org_memberships
+        self.results: Dict[str, Any] = {
             "group_memberships": [],
-            "users_without_org_memberships": [],
-            "users_with_org_memberships": [],
-            "group_admins_excluded": [],
+            "users_without_org_memberships": self._new_user_columns(),
+            "users_with_org_memberships": self._new_user_columns(),
+            "group_admins_excluded": self._new_user_columns(),
+            "org_memberships": {"user_index": [], "org_membership_id": [], "org_id": [], "org_name": []},
             "errors": []
         }
     
+    @staticmethod
+    def _new_user_columns() -> Dict[str, List[Any]]:
+        """Create an empty column-wise user bucket."""
+        return {"user_id": [], "email": [], "name": [], "role": [], "org_membership_count": []}
+    
+    def _add_user(self, bucket: str, user_id: str, email: str, name: str, role: str,
+                  org_memberships: List[Dict]):
+        """
+        Append a user to a results bucket.
+        
+        Args:
+            bucket: Name of the results bucket
+            user_id: Snyk user ID
+            email: User email
+            name: User name
+            role: Group role name
+            org_memberships: The user's organization membership objects
+        """
+        columns = self.results[bucket]
+        user_index = len(columns["user_id"])
+        columns["user_id"].append(user_id)
+        columns["email"].append(email)
+        columns["name"].append(name)
+        columns["role"].append(role)
+        columns["org_membership_count"].append(len(org_memberships))
+        
+        if bucket != "users_with_org_memberships":
+            return
+        
+        org_table = self.results["org_memberships"]
+        for org_membership in org_memberships:
+            # Extract org details from relationships.org.data
+            org_data = org_membership.get("relationships", {}).get("org", {}).get("data", {})
+            org_table["user_index"].append(user_index)
+            org_table["org_membership_id"].append(org_membership.get("id"))
+            org_table["org_id"].append(org_data.get("id"))
+            org_table["org_name"].append(org_data.get("attributes", {}).get("name", "Unknown"))
+    
+    @staticmethod
+    def _extract_member(membership: Dict) -> Optional[Tuple[str, str, str, str]]:
+        """
+        Extract user details from a group membership.
+        
+        Args:
+            membership: Group membership object
+            
+        Returns:
+            Tuple of (user ID, email, name, role name), or None if the membership has no user ID
+        """
+        relationships = membership.get("relationships", {})
+        user_data = relationships.get("user", {}).get("data") or {}
+        user_id = user_data.get("id")
+        if not user_id:
+            return None
+        
+        user_attributes = user_data.get("attributes", {})
+        role_data = relationships.get("role", {}).get("data") or {}
+        return (
+            user_id,
+            user_attributes.get("email", "Unknown"),
+            user_attributes.get("name", "Unknown"),
+            role_data.get("attributes", {}).get("name", "Unknown"),
+        )
+    
+    def _get_user_org_memberships(self, user_id: str) -> Optional[List[Dict]]:
+        """
+        Get one user's organization memberships, logging rather than raising on failure.
+        
+        Args:
+            user_id: Snyk user ID
+            
+        Returns:
+            List of organization membership objects, or None if they could not be fetched
+        """
+        try:
+            return self.client.get_org_memberships(self.group_id, user_id)
+        except SnykAPIError as e:
+            log.error("%s", e)
+            return None
+    
+    def _prefetch_all_org_memberships(self, stop: threading.Event) -> "Future[Dict[str, List[Dict]]]":
+        """
+        Start listing the group's org memberships on a background thread.
+        
+        The thread is a daemon and checks the stop event between pages, so returning early
+        or exiting (e.g. on Ctrl-C) never waits for the whole listing to finish.
+        
+        Args:
+            stop: Event that stops the listing once set
+            
+        Returns:
+            Future resolving to the org memberships grouped by user ID
+        """
+        future: "Future[Dict[str, List[Dict]]]" = Future()
+        
+        def run():
+            try:
+                future.set_result(self.client.get_all_org_memberships(self.group_id, stop=stop))
+            except BaseException as e:
+                future.set_exception(e)
+        
+        threading.Thread(target=run, name="org-memberships-prefetch", daemon=True).start()
+        return future
+    
     def check_memberships(self) -> Dict[str, Any]:
         """
         Check group memberships and their associated org memberships.
@@ -267,151 +876,215 @@ class MembershipChecker:
         Returns:
             Dictionary containing results
         """
-        logging.info(f"Fetching group memberships for group {self.group_id}")
+        log.info("Fetching group memberships for group %s", self.group_id)
         if self.role_name:
-            logging.info(f"Filtering by role_name: {self.role_name}")
+            log.info("Filtering by role_name: %s", self.role_name)
+        
+        # The group-wide org membership listing does not depend on the group memberships,
+        # so page through it in the background while the group memberships are fetched
+        stop_prefetch = threading.Event()
+        org_memberships_future = None
+        if not self.per_user_lookup:
+            log.info("Fetching all org memberships for group %s", self.group_id)
+            org_memberships_future = self._prefetch_all_org_memberships(stop_prefetch)
         
         # Get group memberships
-        group_memberships = self.client.get_group_memberships(self.group_id, self.role_name)
+        try:
+            group_memberships = self.client.get_group_memberships(self.group_id, self.role_name)
+        except SnykAPIError as e:
+            stop_prefetch.set()
+            log.error("%s", e)
+            self.results["errors"].append(str(e))
+            return self.results
+        except BaseException:
+            # e.g. KeyboardInterrupt: stop the background listing rather than finishing it
+            stop_prefetch.set()
+            raise
         
         if not group_memberships:
-            logging.warning("No group memberships found")
+            stop_prefetch.set()
+            log.warning("No group memberships found")
             return self.results
         
-        logging.info(f"Found {len(group_memberships)} group membership(s)")
+        log.info("Found %d group membership(s)", len(group_memberships))
         self.results["group_memberships"] = group_memberships
         
-        # Check org memberships for each user
-        total_users = len(group_memberships)
-        for idx, membership in enumerate(group_memberships, 1):
-            # Extract user data from relationships
-            relationships = membership.get("relationships", {})
-            user_data = relationships.get("user", {}).get("data", {})
-            user_id = user_data.get("id")
-            user_attributes = user_data.get("attributes", {})
-            
-            # Extract user email and name
-            user_email = user_attributes.get("email", "Unknown")
-            user_name = user_attributes.get("name", "Unknown")
-            
-            # Extract role from relationships
-            role_data = relationships.get("role", {}).get("data", {})
-            if role_data:
-                role_name = role_data.get("attributes", {}).get("name", "Unknown")
-            else:
-                role_name = "Unknown"
-            
-            if not user_id:
-                logging.warning(f"Could not extract user ID from membership: {membership.get('id')}")
+        # Extract user details from each membership in a single pass, indexed by role
+        users = []
+        users_by_role = defaultdict(list)
+        for membership in group_memberships:
+            user = self._extract_member(membership)
+            if user is None:
+                log.warning("Could not extract user ID from membership: %s", membership.get("id"))
+                continue
+            users.append(user)
+            users_by_role[user[3]].append(user)
+        
+        if log.isEnabledFor(logging.INFO):
+            log.info("Users by role: %s", ", ".join(
+                f"{role}: {len(role_users)}" for role, role_users in sorted(users_by_role.items())))
+        
+        # Group Admins have access to all orgs by virtue of their role, so they are always
+        # excluded; record them now and skip looking up their org memberships
+        for user_id, user_email, user_name, role_name in users_by_role.get("Group Admin", []):
+            log.info("User %s is a Group Admin - excluding from org membership check (Group Admins have access to all orgs)", user_email)
+            self._add_user("group_admins_excluded", user_id, user_email, user_name, role_name, [])
+        users = [user for user in users if user[3] != "Group Admin"]
+        
+        if not users:
+            # Nobody left to check, so the org membership listing is not needed
+            stop_prefetch.set()
+            log.info("No users left to check after excluding Group Admins")
+            return self.results
+        
+        total_users = len(users)
+        all_org_memberships: List[Optional[List[Dict]]]
+        if org_memberships_future is None:
+            # Per-user lookup: fetch org memberships for each user concurrently; the requests are I/O-bound,
+            # and the client's rate limiter keeps the overall request rate within quota
+            log.info("Checking org memberships for %d user(s) with concurrency %d", total_users, self.concurrency)
+            with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+                all_org_memberships = list(executor.map(
+                    lambda user: self._get_user_org_memberships(user[0]),
+                    users
+                ))
+        else:
+            # List every org membership in the group once and look users up locally,
+            # rather than issuing one paginated query per user
+            try:
+                org_memberships_by_user = org_memberships_future.result()
+            except KeyboardInterrupt:
+                stop_prefetch.set()
+                raise
+            except SnykAPIError as e:
+                # Without the complete listing no user can be classified reliably
+                log.error("%s - aborting org membership check", e)
+                self.results["errors"].append(str(e))
+                return self.results
+            all_org_memberships = [org_memberships_by_user.get(user[0], []) for user in users]
+        
+        for idx, ((user_id, user_email, user_name, role_name), org_memberships) in enumerate(
+                zip(users, all_org_memberships), 1):
+            if org_memberships is None:
+                # The lookup failed; don't guess which bucket this user belongs in
+                self.results["errors"].append(f"Could not fetch org memberships for user {user_email} (ID: {user_id})")
                 continue
+            log.info("Checked org memberships for user %d/%d: %s (ID: %s), Role: %s",
+                     idx, total_users, user_email, user_id, role_name)
+            log.debug("User %s org memberships count: %d", user_email, len(org_memberships))
             
-            logging.info(f"Checking org memberships for user {idx}/{total_users}: {user_email} (ID: {user_id}), Role: {role_name}")
-            
-            # Get org memberships for this user
-            org_memberships = self.client.get_org_memberships(self.group_id, user_id)
-            
-            # Small delay to avoid rate limiting when processing many users
-            if idx < total_users:
-                time.sleep(0.1)
-            logging.debug(f"User {user_email} org memberships count: {len(org_memberships) if org_memberships else 0}")
-            
-            user_info = {
-                "user_id": user_id,
-                "email": user_email,
-                "name": user_name,
-                "role": role_name,
-                "org_memberships": org_memberships,
-                "org_membership_count": len(org_memberships) if org_memberships else 0
-            }
-            
-            if not org_memberships or len(org_memberships) == 0:
-                # Group Admins have access to all org memberships by virtue of their role,
-                # so they should not be included in users without org memberships
-                if role_name == "Group Admin":
-                    logging.info(f"User {user_email} is a Group Admin - excluding from users without org memberships (Group Admins have access to all orgs)")
-                    self.results["group_admins_excluded"].append(user_info)
-                else:
-                    logging.warning(f"User {user_email} has no organization memberships")
-                    self.results["users_without_org_memberships"].append(user_info)
+            if not org_memberships:
+                log.warning("User %s has no organization memberships", user_email)
+                bucket = "users_without_org_memberships"
             else:
-                logging.info(f"User {user_email} has {len(org_memberships)} organization membership(s)")
-                self.results["users_with_org_memberships"].append(user_info)
+                log.info("User %s has %d organization membership(s)", user_email, len(org_memberships))
+                bucket = "users_with_org_memberships"
+            
+            self._add_user(bucket, user_id, user_email, user_name, role_name, org_memberships)
         
         return self.results
     
-    def get_results_summary(self) -> str:
-        """Generate formatted results summary as a string."""
-        lines = []
-        lines.append("\n" + "="*80)
-        lines.append("SNYK MEMBERSHIP CHECK RESULTS")
-        lines.append("="*80)
+    def _iter_summary(self) -> Iterator[str]:
+        """Generate the formatted results summary line by line."""
+        yield "\n" + "="*80
+        yield "SNYK MEMBERSHIP CHECK RESULTS"
+        yield "="*80
         
-        lines.append(f"\nGroup ID: {self.group_id}")
+        yield f"\nGroup ID: {self.group_id}"
         if self.role_name:
-            lines.append(f"Role Filter: {self.role_name}")
-        
-        lines.append(f"\nTotal Group Memberships Found: {len(self.results['group_memberships'])}")
-        lines.append(f"Users WITH Org Memberships: {len(self.results['users_with_org_memberships'])}")
-        lines.append(f"Users WITHOUT Org Memberships: {len(self.results['users_without_org_memberships'])}")
-        if self.results["group_admins_excluded"]:
-            lines.append(f"Group Admins Excluded (have access to all orgs): {len(self.results['group_admins_excluded'])}")
-        
-        if self.results["group_admins_excluded"]:
-            lines.append("\n" + "-"*80)
-            lines.append("GROUP ADMINS EXCLUDED (Have Access to All Organizations):")
-            lines.append("-"*80)
-            for user in self.results["group_admins_excluded"]:
-                lines.append(f"  • {user['email']} ({user['name']})")
-                lines.append(f"    User ID: {user['user_id']}")
-                lines.append(f"    Role: {user['role']}")
-                lines.append(f"    Note: Group Admins have access to all organizations by virtue of their role")
-                lines.append("")
-        
-        if self.results["users_without_org_memberships"]:
-            lines.append("\n" + "-"*80)
-            lines.append("USERS WITHOUT ORGANIZATION MEMBERSHIPS:")
-            lines.append("-"*80)
-            for user in self.results["users_without_org_memberships"]:
-                lines.append(f"  • {user['email']} ({user['name']})")
-                lines.append(f"    User ID: {user['user_id']}")
-                lines.append(f"    Role: {user['role']}")
-                lines.append("")
-        
-        if self.results["users_with_org_memberships"]:
-            lines.append("\n" + "-"*80)
-            lines.append("USERS WITH ORGANIZATION MEMBERSHIPS:")
-            lines.append("-"*80)
-            for user in self.results["users_with_org_memberships"]:
-                lines.append(f"  • {user['email']} ({user['name']})")
-                lines.append(f"    User ID: {user['user_id']}")
-                lines.append(f"    Role: {user['role']}")
-                lines.append(f"    Org Memberships: {user['org_membership_count']}")
-                if user['org_memberships']:
-                    for org_membership in user['org_memberships']:
-                        # Extract org name from relationships.org.data.attributes.name
-                        org_relationships = org_membership.get('relationships', {})
-                        org_data = org_relationships.get('org', {}).get('data', {})
-                        org_name = org_data.get('attributes', {}).get('name', 'Unknown')
-                        lines.append(f"      - {org_name}")
-                lines.append("")
-        
-        lines.append("="*80)
-        return "\n".join(lines)
-    
-    def print_results(self, log_file: Optional[str] = None):
+            yield f"Role Filter: {self.role_name}"
+        
+        admins = self.results["group_admins_excluded"]
+        without_orgs = self.results["users_without_org_memberships"]
+        with_orgs = self.results["users_with_org_memberships"]
+        org_table = self.results["org_memberships"]
+        
+        yield f"\nTotal Group Memberships Found: {len(self.results['group_memberships'])}"
+        yield f"Users WITH Org Memberships: {len(with_orgs['user_id'])}"
+        yield f"Users WITHOUT Org Memberships: {len(without_orgs['user_id'])}"
+        if admins["user_id"]:
+            yield f"Group Admins Excluded (have access to all orgs): {len(admins['user_id'])}"
+        if self.results["errors"]:
+            yield f"Errors (results are incomplete): {len(self.results['errors'])}"
+        
+        if self.results["errors"]:
+            yield "\n" + "-"*80
+            yield "ERRORS:"
+            yield "-"*80
+            for error in self.results["errors"]:
+                yield f"  • {error}"
+            yield ""
+        
+        if admins["user_id"]:
+            yield "\n" + "-"*80
+            yield "GROUP ADMINS EXCLUDED (Have Access to All Organizations):"
+            yield "-"*80
+            for i in range(len(admins["user_id"])):
+                yield f"  • {admins['email'][i]} ({admins['name'][i]})"
+                yield f"    User ID: {admins['user_id'][i]}"
+                yield f"    Role: {admins['role'][i]}"
+                yield f"    Note: Group Admins have access to all organizations by virtue of their role"
+                yield ""
+        
+        if without_orgs["user_id"]:
+            yield "\n" + "-"*80
+            yield "USERS WITHOUT ORGANIZATION MEMBERSHIPS:"
+            yield "-"*80
+            for i in range(len(without_orgs["user_id"])):
+                yield f"  • {without_orgs['email'][i]} ({without_orgs['name'][i]})"
+                yield f"    User ID: {without_orgs['user_id'][i]}"
+                yield f"    Role: {without_orgs['role'][i]}"
+                yield ""
+        
+        if with_orgs["user_id"]:
+            yield "\n" + "-"*80
+            yield "USERS WITH ORGANIZATION MEMBERSHIPS:"
+            yield "-"*80
+            # Org rows are appended in user order, so each user's orgs form a contiguous run
+            org_row = 0
+            org_rows = len(org_table["user_index"])
+            for i in range(len(with_orgs["user_id"])):
+                yield f"  • {with_orgs['email'][i]} ({with_orgs['name'][i]})"
+                yield f"    User ID: {with_orgs['user_id'][i]}"
+                yield f"    Role: {with_orgs['role'][i]}"
+                yield f"    Org Memberships: {with_orgs['org_membership_count'][i]}"
+                while org_row < org_rows and org_table["user_index"][org_row] == i:
+                    yield f"      - {org_table['org_name'][org_row]}"
+                    org_row += 1
+                yield ""
+        
+        yield "="*80
+    
+    def get_results_summary(self) -> str:
+        """Generate formatted results summary as a string."""
+        return "\n".join(self._iter_summary())
+    
+    def print_results(self, log_handler: Optional[logging.StreamHandler] = None):
         """Print formatted results to console and log file."""
-        summary = self.get_results_summary()
-        print(summary)
-        # Write the summary directly to the log file (not through logging)
-        if log_file:
-            try:
-                with open(log_file, 'a') as f:
-                    f.write(summary + "\n")
-            except Exception as e:
-                logging.warning(f"Could not write summary to log file: {str(e)}")
+        # Write the summary directly to the log file's open stream (not through logging),
+        # holding the handler's lock so no log record is interleaved with it
+        if log_handler:
+            log_handler.acquire()
+        
+        # Stream each line to both outputs instead of building the whole summary in memory
+        try:
+            log_stream = log_handler.stream if log_handler else None
+            for line in self._iter_summary():
+                sys.stdout.write(line + "\n")
+                if log_stream:
+                    try:
+                        log_stream.write(line + "\n")
+                    except Exception as e:
+                        log.warning("Could not write summary to log file: %s", e)
+                        log_stream = None
+            if log_stream:
+                log_stream.flush()
+        finally:
+            if log_handler:
+                log_handler.release()
 
 
-def setup_logging(log_dir: str = "logs", verbose: bool = False) -> str:
+def setup_logging(log_dir: str = "logs", verbose: bool = False) -> Tuple[str, logging.FileHandler]:
     """
     Set up logging to both console and file.
     
@@ -420,7 +1093,7 @@ def setup_logging(log_dir: str = "logs", verbose: bool = False) -> str:
         verbose: If True, include DEBUG, INFO, and WARNING logs in file. If False, only WARNING and above.
         
     Returns:
-        Path to the log file
+        Tuple of the path to the log file and the handler writing to it
     """
     if not os.path.exists(log_dir):
         os.makedirs(log_dir)
@@ -446,7 +1119,7 @@ def setup_logging(log_dir: str = "logs", verbose: bool = False) -> str:
     root_logger.addHandler(console_handler)
     root_logger.addHandler(file_handler)
     
-    return log_file
+    return log_file, file_handler
 
 
 def main():
@@ -504,6 +1177,55 @@ Examples:
         help="Output file path for JSON results (optional)"
     )
     
+    parser.add_argument(
+        "--page-size",
+        default=str(SnykAPIClient.DEFAULT_PAGE_SIZE),
+        help=f"Number of results requested per page (1-{SnykAPIClient.MAX_PAGE_SIZE}), or 'auto' to probe "
+             f"for the largest size each endpoint accepts (default: {SnykAPIClient.DEFAULT_PAGE_SIZE})"
+    )
+    
+    parser.add_argument(
+        "--per-user-lookup",
+        action="store_true",
+        help="Query org memberships per user instead of listing all org memberships in the group once "
+             "(fewer requests when --role-name selects a small subset of a large group)"
+    )
+    
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=os.environ.get("SNYK_CONCURRENCY", 20),
+        help="Number of users whose org memberships are fetched in parallel with --per-user-lookup "
+             "(default: 20, can also be set via SNYK_CONCURRENCY environment variable)"
+    )
+    
+    parser.add_argument(
+        "--rate-limit",
+        type=float,
+        default=50.0,
+        help="Maximum number of API requests per second; the client backs off automatically "
+             "when rate limited (default: 50)"
+    )
+    
+    parser.add_argument(
+        "--cache-ttl",
+        type=float,
+        default=300,
+        help="Seconds that cached org membership results stay valid (default: 300)"
+    )
+    
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write the org membership cache"
+    )
+    
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Ignore cached org membership results and fetch fresh data (the cache is still updated)"
+    )
+    
     parser.add_argument(
         "--verbose",
         "--debug",
@@ -522,50 +1244,117 @@ Examples:
     if not args.group_id:
         parser.error("Group ID is required. Provide --group-id or set GROUP_ID environment variable.")
     
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1.")
+    
+    if args.rate_limit <= 0:
+        parser.error("--rate-limit must be greater than 0.")
+    
+    if args.cache_ttl < 0:
+        parser.error("--cache-ttl must not be negative.")
+    
+    if args.page_size != "auto":
+        try:
+            args.page_size = int(args.page_size)
+        except ValueError:
+            parser.error("--page-size must be a number or 'auto'.")
+        if not 1 <= args.page_size <= SnykAPIClient.MAX_PAGE_SIZE:
+            parser.error(f"--page-size must be between 1 and {SnykAPIClient.MAX_PAGE_SIZE}.")
+    
     # Set up logging
-    log_file = setup_logging(verbose=args.verbose)
-    logging.info("Starting Snyk membership check")
-    logging.info(f"Group ID: {args.group_id}")
+    log_file, log_handler = setup_logging(verbose=args.verbose)
+    log.info("Starting Snyk membership check")
+    log.info("Group ID: %s", args.group_id)
     if args.role_name:
-        logging.info(f"Role Name Filter: {args.role_name}")
-    logging.info(f"Region: {args.region}")
-    logging.info(f"API Version: {args.version}")
+        log.info("Role Name Filter: %s", args.role_name)
+    log.info("Region: %s", args.region)
+    log.info("API Version: %s", args.version)
     
     try:
+        # Initialize response cache
+        cache = None
+        if not args.no_cache:
+            try:
+                cache = ResponseCache(ttl=args.cache_ttl, refresh=args.refresh)
+            except OSError as e:
+                # The cache is only an optimization, so run without it rather than fail
+                log.warning("Could not create response cache, continuing without it: %s", e)
+        
         # Initialize API client
-        client = SnykAPIClient(args.token, args.region, args.version)
+        client = SnykAPIClient(args.token, args.region, args.version,
+                               max_connections=args.concurrency, rate_limit=args.rate_limit,
+                               cache=cache)
+        
+        if args.page_size == "auto":
+            client.probe_page_size(args.group_id)
+        else:
+            client.page_size = args.page_size
         
         # Initialize membership checker
-        checker = MembershipChecker(client, args.group_id, args.role_name)
+        checker = MembershipChecker(client, args.group_id, args.role_name,
+                                    concurrency=args.concurrency, per_user_lookup=args.per_user_lookup)
         
         # Perform checks
         results = checker.check_memberships()
         
         # Print results
-        checker.print_results(log_file=log_file)
+        checker.print_results(log_handler=log_handler)
         
         # Save to file if requested
         if args.output:
-            with open(args.output, 'w') as f:
-                json.dump(results, f, indent=2)
-            logging.info(f"Results saved to {args.output}")
+            write_json(args.output, results)
+            log.info("Results saved to %s", args.output)
         
-        logging.info(f"Log file: {log_file}")
+        log.info("Log file: %s", log_file)
         
         # Exit with appropriate code
-        if results["users_without_org_memberships"]:
+        if results["errors"]:
+            log.error("Membership check is incomplete: %d error(s)", len(results["errors"]))
+            sys.exit(1)  # Exit with error if any listing could not be fetched
+        elif results["users_without_org_memberships"]["user_id"]:
             sys.exit(1)  # Exit with error if users without org memberships found
         else:
             sys.exit(0)  # Success
         
     except KeyboardInterrupt:
-        logging.info("Interrupted by user")
+        log.info("Interrupted by user")
         sys.exit(130)
     except Exception as e:
-        logging.error(f"Unexpected error: {str(e)}", exc_info=True)
+        log.error("Unexpected error: %s", e, exc_info=True)
         sys.exit(1)
 
 
+def load_compiled_main() -> Optional[Callable[[], None]]:
+    """
+    Find main() in a mypyc-compiled build of this module, if one sits next to the script.
+    
+    An extension older than the script is ignored, so edits to the source are never
+    silently shadowed by a stale build.
+    
+    Returns:
+        The compiled main function, or None if no up-to-date compiled extension is available
+    """
+    spec = importlib.util.find_spec("find_users_without_org_memberships")
+    if spec is None or spec.origin is None or not isinstance(spec.loader, importlib.machinery.ExtensionFileLoader):
+        return None
+    
+    source_path = os.path.abspath(__file__)
+    if os.path.dirname(os.path.abspath(spec.origin)) != os.path.dirname(source_path):
+        return None
+    
+    if os.path.getmtime(spec.origin) < os.path.getmtime(source_path):
+        log.warning("Compiled extension %s is older than %s - running from source. "
+                    "Rebuild it with mypyc or delete it.", spec.origin, source_path)
+        return None
+    
+    try:
+        module = importlib.import_module("find_users_without_org_memberships")
+    except ImportError:
+        return None
+    return module.main
+
+
 if __name__ == "__main__":
-    main()
+    # Prefer the compiled extension when it has been built, falling back to this source
+    (load_compiled_main() or main)()
 